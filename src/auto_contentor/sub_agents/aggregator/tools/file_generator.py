@@ -4,6 +4,24 @@ import os
 from datetime import datetime
 from google.adk.tools import FunctionTool
 
+
+class _FilenameCharTable(dict):
+    """
+    Bảng ký tự cho str.translate: giữ chữ, số, khoảng trắng và '_', xóa các ký tự khác.
+
+    Bảng được điền dần khi gặp ký tự mới, nên vẫn giữ được chữ có dấu (tiếng Việt)
+    mà không cần dựng sẵn toàn bộ dải Unicode.
+    """
+
+    def __missing__(self, codepoint: int):
+        char = chr(codepoint)
+        value = codepoint if char.isalnum() or char in " _" else None
+        self[codepoint] = value
+        return value
+
+
+_FILENAME_TABLE = _FilenameCharTable()
+
 # 1. Định nghĩa hàm Python thông thường với docstring chi tiết
 def _save_report_as_document(markdown_content: str, campaign_name: str, output_format: str = "docx") -> str:
     """
@@ -23,17 +41,23 @@ def _save_report_as_document(markdown_content: str, campaign_name: str, output_f
 
     # Tạo tên file duy nhất và an toàn
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    safe_campaign_name = "".join(c for c in campaign_name if c.isalnum() or c in (' ', '_')).rstrip()
+    safe_campaign_name = campaign_name.translate(_FILENAME_TABLE).rstrip()
     filename = f"{safe_campaign_name}_{timestamp}.{output_format}"
     output_path = os.path.join(output_dir, filename)
 
     try:
-        # Sử dụng pandoc để chuyển đ���i
+        # Sử dụng pandoc để chuyển đổi. Bỏ qua bước kiểm tra định dạng của
+        # pypandoc vì nó gọi thêm các tiến trình `pandoc --list-*-formats`
+        # mỗi lần chuyển đổi; định dạng đầu vào luôn là markdown.
+        # Khi bỏ kiểm tra, pypandoc không còn tự đổi 'pdf' thành writer 'latex',
+        # nên ta tự làm việc đó; pandoc xuất PDF dựa vào đuôi .pdf của outputfile.
+        to_format = "latex" if output_format == "pdf" else output_format
         pypandoc.convert_text(
             markdown_content,
-            output_format,
+            to_format,
             format="md",
-            outputfile=output_path
+            outputfile=output_path,
+            verify_format=False
         )
         return f"Báo cáo đã được lưu thành công tại: {output_path}"
     except Exception as e:
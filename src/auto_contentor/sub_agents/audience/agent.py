@@ -20,6 +20,7 @@ import asyncio
 from google.adk.agents import LlmAgent
 from .tools import youtube_search_tool
 from .prompt import AUDIENCE_RESEARCH_PROMPT
+from ..base.response_cache import ResponseCache
 
 warnings.filterwarnings("ignore", category=UserWarning, module=".*pydantic.*")
 
@@ -29,6 +30,8 @@ logger = logging.getLogger(__name__)
 MODEL_GEMINI_2_0_FLASH = "gemini-2.0-flash"
 AGENT_MODEL = MODEL_GEMINI_2_0_FLASH
 
+_response_cache = ResponseCache(output_key="audience_persona")
+
 audience_agent = LlmAgent(
     name="AudienceResearchAgent",
     model=AGENT_MODEL,
@@ -36,6 +39,8 @@ audience_agent = LlmAgent(
     description="Analyzes YouTube audience data to create detailed buyer personas.",
     tools=[youtube_search_tool],
     output_key="audience_persona",
+    before_agent_callback=_response_cache.before_agent,
+    after_agent_callback=_response_cache.after_agent,
 )
 
 
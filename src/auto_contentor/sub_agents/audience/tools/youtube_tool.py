@@ -4,7 +4,7 @@ Searches videos and extracts comments for buyer persona analysis
 """
 
 import os
-from googleapiclient.discovery import build
+from functools import lru_cache
 from googleapiclient.errors import HttpError
 import json
 from typing import List, Dict, Any
@@ -17,10 +17,23 @@ class YouTubeDataTool:
         self.api_key = os.getenv('YOUTUBE_API_KEY')
         if not self.api_key:
             raise ValueError("YOUTUBE_API_KEY environment variable is required. Please set it in your .env file.")
-        self.youtube = build('youtube', 'v3', developerKey=self.api_key)
+        # Imported lazily: discovery pulls in httplib2/google-auth, which the
+        # agent process doesn't need until the tool is actually called.
+        from googleapiclient.discovery import build
+        self.youtube = build('youtube', 'v3', developerKey=self.api_key, cache_discovery=False)
         self.max_comments = 20
         self.max_videos = 5
 
+    @staticmethod
+    def _new_http():
+        """Return a fresh HTTP client for a single request
+
+        The service object is shared across tool calls (and threads), but its
+        httplib2 client is not thread-safe, so each request executes on its own.
+        """
+        from googleapiclient.http import build_http
+        return build_http()
+
     def search_videos(self, query: str) -> List[Dict[str, Any]]:
         """Search for videos related to the query"""
         try:
@@ -30,18 +43,18 @@ class YouTubeDataTool:
                 maxResults=self.max_videos,
                 type='video',
                 order='relevance'
-            ).execute()
+            ).execute(http=self._new_http())
 
             videos = []
             for item in search_response['items']:
-                video_data = {
+                snippet = item['snippet']
+                videos.append({
                     'video_id': item['id']['videoId'],
-                    'title': item['snippet']['title'],
-                    'channel': item['snippet']['channelTitle'],
-                    'description': item['snippet']['description'][:200],  # First 200 chars
-                    'published_at': item['snippet']['publishedAt']
-                }
-                videos.append(video_data)
+                    'title': snippet['title'],
+                    'channel': snippet['channelTitle'],
+                    'description': snippet['description'][:200],  # First 200 chars
+                    'published_at': snippet['publishedAt']
+                })
 
             return videos
 
@@ -49,32 +62,65 @@ class YouTubeDataTool:
             print(f"YouTube API error: {e}")
             return []
 
+    def _comments_request(self, video_id: str, max_results: int):
+        """Build (without executing) a commentThreads request for a video"""
+        return self.youtube.commentThreads().list(
+            part='snippet',
+            videoId=video_id,
+            maxResults=max_results,
+            order='relevance'
+        )
+
+    @staticmethod
+    def _parse_comments(comments_response: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Extract comment records from a commentThreads response"""
+        comments = []
+        for item in comments_response['items']:
+            snippet = item['snippet']['topLevelComment']['snippet']
+            comments.append({
+                'text': snippet['textDisplay'],
+                'author': snippet['authorDisplayName'],
+                'likes': snippet['likeCount'],
+                'published_at': snippet['publishedAt']
+            })
+        return comments
+
     def get_video_comments(self, video_id: str, max_results: int = 10) -> List[Dict[str, Any]]:
         """Get comments from a specific video"""
         try:
-            comments_response = self.youtube.commentThreads().list(
-                part='snippet',
-                videoId=video_id,
-                maxResults=max_results,
-                order='relevance'
-            ).execute()
-
-            comments = []
-            for item in comments_response['items']:
-                comment_data = {
-                    'text': item['snippet']['topLevelComment']['snippet']['textDisplay'],
-                    'author': item['snippet']['topLevelComment']['snippet']['authorDisplayName'],
-                    'likes': item['snippet']['topLevelComment']['snippet']['likeCount'],
-                    'published_at': item['snippet']['topLevelComment']['snippet']['publishedAt']
-                }
-                comments.append(comment_data)
-
-            return comments
+            comments_response = self._comments_request(video_id, max_results).execute(http=self._new_http())
+            return self._parse_comments(comments_response)
 
         except HttpError as e:
             print(f"Error getting comments for video {video_id}: {e}")
             return []
 
+    def get_comments_for_videos(self, videos: List[Dict[str, Any]], max_results: int = 10) -> List[List[Dict[str, Any]]]:
+        """Get comments for several videos in one batch HTTP request
+
+        Returns one list of comments per video, in the same order as `videos`.
+        Videos whose request fails (e.g. comments disabled) get an empty list.
+        """
+        results: List[List[Dict[str, Any]]] = [[] for _ in videos]
+
+        def on_response(request_id, response, exception):
+            index = int(request_id)
+            if exception is not None:
+                print(f"Error getting comments for video {videos[index]['video_id']}: {exception}")
+                return
+            results[index] = self._parse_comments(response)
+
+        batch = self.youtube.new_batch_http_request(callback=on_response)
+        for index, video in enumerate(videos):
+            batch.add(self._comments_request(video['video_id'], max_results), request_id=str(index))
+
+        try:
+            batch.execute(http=self._new_http())
+        except HttpError as e:
+            print(f"YouTube batch request error: {e}")
+
+        return results
+
     def collect_audience_data(self, query: str) -> Dict[str, Any]:
         """Main function to collect audience data from YouTube"""
         print(f"🔍 Searching YouTube for: '{query}'")
@@ -86,16 +132,12 @@ class YouTubeDataTool:
 
         print(f"📹 Found {len(videos)} relevant videos")
 
-        # Step 2: Collect comments from videos
+        # Step 2: Collect comments from all videos in a single batch request
         all_comments = []
         comments_per_video = max(1, self.max_comments // len(videos))
 
-        for video in videos:
-            video_comments = self.get_video_comments(
-                video['video_id'],
-                max_results=comments_per_video
-            )
-
+        results = self.get_comments_for_videos(videos, max_results=comments_per_video)
+        for video, video_comments in zip(videos, results):
             # Add video context to comments
             for comment in video_comments:
                 comment['video_title'] = video['title']
@@ -103,16 +145,23 @@ class YouTubeDataTool:
 
             all_comments.extend(video_comments)
 
-            # Stop if we have enough comments
-            if len(all_comments) >= self.max_comments:
-                break
-
         # Limit to max_comments
         all_comments = all_comments[:self.max_comments]
 
         print(f"💬 Collected {len(all_comments)} comments for analysis")
 
-        # Step 3: Structure the data for analysis
+        # Step 3: Summarize engagement and date range in a single pass
+        engagement = 0
+        oldest = newest = None
+        for comment in all_comments:
+            engagement += comment['likes']
+            published_at = comment['published_at']
+            if oldest is None or published_at < oldest:
+                oldest = published_at
+            if newest is None or published_at > newest:
+                newest = published_at
+
+        # Step 4: Structure the data for analysis
         audience_data = {
             "query": query,
             "videos_analyzed": len(videos),
@@ -120,11 +169,11 @@ class YouTubeDataTool:
             "videos": videos,
             "comments": all_comments,
             "summary": {
-                "top_channels": list(set([v['channel'] for v in videos])),
-                "comment_engagement": sum([c['likes'] for c in all_comments]),
+                "top_channels": list({v['channel'] for v in videos}),
+                "comment_engagement": engagement,
                 "date_range": {
-                    "oldest": min([c['published_at'] for c in all_comments]) if all_comments else None,
-                    "newest": max([c['published_at'] for c in all_comments]) if all_comments else None
+                    "oldest": oldest,
+                    "newest": newest
                 }
             }
         }
@@ -132,6 +181,12 @@ class YouTubeDataTool:
         return audience_data
 
 
+@lru_cache(maxsize=1)
+def _get_youtube_tool() -> YouTubeDataTool:
+    """Return a shared YouTubeDataTool so the API client is only built once"""
+    return YouTubeDataTool()
+
+
 # Create the tool function for ADK agent
 def youtube_search_tool(query: str) -> str:
     """
@@ -144,7 +199,7 @@ def youtube_search_tool(query: str) -> str:
     Returns:
         JSON string with structured audience data from YouTube
     """
-    tool = YouTubeDataTool()
+    tool = _get_youtube_tool()
     data = tool.collect_audience_data(query)
 
     # Return as JSON string for the agent to process
@@ -0,0 +1,113 @@
+# Copyright 2025 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""In-process response cache for the research sub-agents."""
+
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple
+
+from google.adk.agents.callback_context import CallbackContext
+from google.genai import types
+
+DEFAULT_TTL_SECONDS = 3600
+DEFAULT_MAX_ENTRIES = 256
+
+
+class ResponseCache:
+    """Caches an agent's final output for the opening turn of a session.
+
+    The key is a SHA-256 of the text of the session's first user message.
+    Later turns depend on the session's history, so they never read or
+    write the cache. The cache is shared by every session in the process.
+
+    Register `before_agent` and `after_agent` as the agent's callbacks. On a
+    hit the agent is skipped and the cached output is written back to
+    `output_key`, so downstream agents see the same state as after a real run.
+    """
+
+    def __init__(
+        self,
+        output_key: str,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        self.output_key = output_key
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        # Invocations that missed, mapped to (key, output_key value before the run).
+        self._pending: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+
+    def _key(self, callback_context: CallbackContext) -> Optional[str]:
+        """Returns the cache key, or None when this is not a session's first turn."""
+        session = callback_context._invocation_context.session
+        invocation_id = callback_context.invocation_id
+        if any(event.invocation_id != invocation_id for event in session.events):
+            return None
+
+        content = callback_context.user_content
+        if not content or not content.parts:
+            return None
+        text = "".join(part.text or "" for part in content.parts)
+        if not text:
+            return None
+        return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def before_agent(self, callback_context: CallbackContext) -> Optional[types.Content]:
+        """Returns the cached output, skipping the agent, if there is a fresh entry."""
+        key = self._key(callback_context)
+        if not key:
+            return None
+
+        entry = self._entries.get(key)
+        if entry is not None and time.monotonic() - entry[0] > self.ttl_seconds:
+            del self._entries[key]
+            entry = None
+
+        if entry is None:
+            # Session state outlives the invocation, so remember what was there
+            # before the run; after_agent only caches a value this run wrote.
+            self._pending[callback_context.invocation_id] = (
+                key,
+                callback_context.state.get(self.output_key),
+            )
+            # Runs that fail never reach after_agent; don't let them pile up.
+            while len(self._pending) > self.max_entries:
+                self._pending.popitem(last=False)
+            return None
+
+        output = entry[1]
+        self._entries.move_to_end(key)
+        callback_context.state[self.output_key] = output
+        return types.Content(role="model", parts=[types.Part(text=output)])
+
+    def after_agent(self, callback_context: CallbackContext) -> None:
+        """Stores the output this invocation wrote to `output_key`, if any."""
+        pending = self._pending.pop(callback_context.invocation_id, None)
+        if pending is None:
+            # Served from cache, or not a cacheable turn.
+            return None
+
+        key, previous = pending
+        output = callback_context.state.get(self.output_key)
+        if not isinstance(output, str) or not output or output == previous:
+            return None
+
+        self._entries[key] = (time.monotonic(), output)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        return None
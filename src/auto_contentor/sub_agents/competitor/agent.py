@@ -20,6 +20,7 @@ import asyncio
 from google.adk.agents import LlmAgent
 from google.adk.tools import google_search
 from .prompt import COMPETITOR_ANALYSIS_PROMPT
+from ..base.response_cache import ResponseCache
 
 warnings.filterwarnings("ignore", category=UserWarning, module=".*pydantic.*")
 
@@ -29,6 +30,8 @@ logger = logging.getLogger(__name__)
 MODEL_GEMINI_2_0_FLASH = "gemini-2.0-flash"
 AGENT_MODEL = MODEL_GEMINI_2_0_FLASH
 
+_response_cache = ResponseCache(output_key="competitor_swot")
+
 competitor_agent = LlmAgent(
     name="CompetitorAnalysisAgent",
     model=AGENT_MODEL,
@@ -36,6 +39,8 @@ competitor_agent = LlmAgent(
     description="Performs a SWOT analysis on competitors in a given industry.",
     tools=[google_search],
     output_key="competitor_swot",
+    before_agent_callback=_response_cache.before_agent,
+    after_agent_callback=_response_cache.after_agent,
 )
 
 
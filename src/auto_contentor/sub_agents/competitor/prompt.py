@@ -44,9 +44,9 @@ You will receive a JSON object with campaign details. You must use the following
 - `Region`: The geographic region for the analysis.
 
 **Tasks:**
-1.  For each competitor in the `Competitors` list, use the `google_search` tool to find information about their strengths, weaknesses, opportunities, and threats. Frame your search query like: "SWOT analysis of [competitor] for [Topic] in [Region]".
-2.  If the `Competitors` list is empty, use the `google_search` tool to find the top competitors for the given `Topic` in the specified `Region`.
-3.  Analyze the search results to build a SWOT profile for each competitor.
+1.  If the `Competitors` list is empty, first use the `google_search` tool to find the top competitors for the given `Topic` in the specified `Region`.
+2.  Research all competitors at once: issue one `google_search` query per competitor, all in the same step, rather than searching for one competitor and waiting for its results before the next. Frame each query like: "SWOT analysis of [competitor] for [Topic] in [Region]".
+3.  Analyze the search results to build a SWOT profile (strengths, weaknesses, opportunities, threats) for each competitor.
 4.  Format the final output as a Markdown report.
 """
 
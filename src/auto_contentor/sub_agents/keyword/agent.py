@@ -2,13 +2,18 @@ from google.adk.agents import LlmAgent
 from google.adk.tools import google_search
 
 from . import prompts
+from ..base.response_cache import ResponseCache
 
 MODEL = "gemini-2.5-flash"
 
+_response_cache = ResponseCache(output_key="keyword_analysis")
+
 keyword_agent = LlmAgent(
     name="keyword_agent",
     model=MODEL,
     instruction=prompts.KEYWORD_RESEARCH_PROMPT,
     tools=[google_search],
     output_key="keyword_analysis",
+    before_agent_callback=_response_cache.before_agent,
+    after_agent_callback=_response_cache.after_agent,
 )
\ No newline at end of file
@@ -30,7 +30,8 @@ You will receive a JSON object with campaign details. You must use the following
     - If the `Seed Keywords` list is not empty, use it as your primary list of keywords to research.
     - If `Seed Keywords` is empty, use the `Topic` to formulate a search query to find initial keywords. For example, if the topic is "AI in marketing", search for "top keywords for AI in marketing".
 2.  **Perform Research:**
-    - For each keyword, use the `google_search` tool to find its search volume, competition level, and CPC. Frame your query like: "search volume and competition for 'keyword' in [Region]".
+    - Research all keywords at once: issue one `google_search` query per keyword, all in the same step, to find its search volume, competition level, and CPC. Do not search one keyword and wait for its results before searching the next.
+    - Frame each query like: "search volume and competition for 'keyword' in [Region]".
 3.  **Analyze and Select:**
     - From your research, select up to 20 of the most relevant keywords.
     - Prioritize keywords with a good balance of high search volume and low competition.
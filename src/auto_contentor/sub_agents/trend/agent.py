@@ -20,6 +20,7 @@ import asyncio
 from google.adk.agents import LlmAgent
 from google.adk.tools import google_search
 from .prompt import TREND_ANALYSIS_PROMPT
+from ..base.response_cache import ResponseCache
 
 warnings.filterwarnings("ignore", category=UserWarning, module=".*pydantic.*")
 
@@ -29,6 +30,8 @@ logger = logging.getLogger(__name__)
 MODEL_GEMINI_2_0_FLASH = "gemini-2.0-flash"
 AGENT_MODEL = MODEL_GEMINI_2_0_FLASH
 
+_response_cache = ResponseCache(output_key="trend_analysis")
+
 trend_agent = LlmAgent(
     name="TrendAnalysisAgent",
     model=AGENT_MODEL,
@@ -36,6 +39,8 @@ trend_agent = LlmAgent(
     description="Analyzes content trends using Google Search.",
     tools=[google_search],
     output_key="trend_analysis",
+    before_agent_callback=_response_cache.before_agent,
+    after_agent_callback=_response_cache.after_agent,
 )
 
 